@@ -0,0 +1 @@
+"""Micro-benchmarks for hot paths. Run with ``python -m benchmarks.<module>``."""
@@ -0,0 +1,142 @@
+"""Compare the legacy pydantic-parsed webhook route with the raw-body fast path.
+
+Usage: python -m benchmarks.bench_telegram_webhook [iterations]
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Any
+
+from fastapi import APIRouter, FastAPI, Header, HTTPException, Request
+
+from src.infrastructure.fastapi.telegram_router import create_telegram_router
+from src.interface_adapters.controllers.telegram_controller import TelegramController
+from src.use_cases.errors import InvalidTelegramSecretError
+from src.use_cases.get_last_chat import GetLastChatUseCase
+from src.use_cases.process_telegram_webhook import ProcessTelegramWebhookUseCase
+
+_SECRET = "benchmark-secret"
+
+
+class _MemoryChatStateGateway:
+    def __init__(self) -> None:
+        self._last_chat_id: int | None = None
+
+    def get_last_chat_id(self) -> int | None:
+        return self._last_chat_id
+
+    def set_last_chat_id(self, chat_id: int) -> None:
+        self._last_chat_id = chat_id
+
+
+def _controller() -> TelegramController:
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.WARNING)
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    chat_state_gateway = _MemoryChatStateGateway()
+    return TelegramController(
+        process_webhook_use_case=ProcessTelegramWebhookUseCase(chat_state_gateway, _SECRET, logger),
+        get_last_chat_use_case=GetLastChatUseCase(chat_state_gateway, logger),
+    )
+
+
+def _legacy_router(telegram_controller: TelegramController) -> APIRouter:
+    router = APIRouter()
+
+    @router.post("/telegram/webhook")
+    async def telegram_webhook(
+        update: dict[str, Any],
+        request: Request,
+        x_telegram_bot_api_secret_token: str | None = Header(default=None),
+    ) -> dict[str, Any]:
+        try:
+            request_id = getattr(request.state, "request_id", "")
+            return telegram_controller.handle_webhook(update, x_telegram_bot_api_secret_token, request_id=request_id)
+        except InvalidTelegramSecretError as exc:
+            raise HTTPException(status_code=403, detail=str(exc)) from exc
+
+    return router
+
+
+def _update(update_id: int) -> dict[str, Any]:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "from": {"id": 42, "is_bot": False, "first_name": "Ana", "language_code": "es"},
+            "chat": {"id": -1001234567890, "type": "supergroup", "title": "Ops"},
+            "date": 1771353250,
+            "text": "hola " * 200,
+            "entities": [{"offset": 0, "length": 4, "type": "bold"}] * 20,
+        },
+    }
+
+
+async def _call(app: FastAPI, body: bytes, headers: list[tuple[bytes, bytes]]) -> int:
+    status_code = 0
+    body_sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/telegram/webhook",
+        "raw_path": b"/telegram/webhook",
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return status_code
+
+
+async def _measure(app: FastAPI, secret: str, iterations: int) -> float:
+    bodies = [json.dumps(_update(update_id)).encode("utf-8") for update_id in range(iterations)]
+    started_at = time.perf_counter()
+    for body in bodies:
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+            (b"x-telegram-bot-api-secret-token", secret.encode("utf-8")),
+        ]
+        await _call(app, body, headers)
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+
+async def _main(iterations: int) -> None:
+    legacy_app = FastAPI()
+    legacy_app.include_router(_legacy_router(_controller()))
+    fast_app = FastAPI()
+    fast_app.include_router(create_telegram_router(_controller()))
+
+    for label, secret in (("valid", _SECRET), ("forged", "wrong-secret")):
+        legacy_us = await _measure(legacy_app, secret, iterations)
+        fast_us = await _measure(fast_app, secret, iterations)
+        print(
+            f"{label:>6}: legacy={legacy_us:8.1f} us/req fast_path={fast_us:8.1f} us/req "
+            f"speedup={legacy_us / fast_us:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
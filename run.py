@@ -1,11 +1,13 @@
-import threading
-import time
+import asyncio
+from collections.abc import Callable
 
 import httpx
 import uvicorn
 
 from src.infrastructure.fastapi.app import app, logger, settings
-from src.infrastructure.httpx.telegram_webhook_client import TelegramWebhookClient
+from src.infrastructure.httpx.telegram_webhook_client import AsyncTelegramWebhookClient
+from src.infrastructure.startup.startup_orchestrator import StartupOrchestrator
+from src.infrastructure.uvicorn.ready_server import ReadyServer
 
 
 def _normalize_webhook_path(path: str) -> str:
@@ -17,20 +19,16 @@ def _normalize_webhook_path(path: str) -> str:
     return clean
 
 
-def _wait_for_server_started(
-    server: uvicorn.Server, server_thread: threading.Thread, timeout_seconds: float = 20.0
-) -> bool:
-    deadline = time.time() + timeout_seconds
-    while time.time() < deadline:
-        if server.started:
-            return True
-        if not server_thread.is_alive():
-            return False
-        time.sleep(0.2)
-    return False
+async def _serve(server: ReadyServer) -> None:
+    try:
+        await server.serve()
+    except KeyboardInterrupt:
+        logger.info("Interrupcion recibida. Cerrando servicios...")
+    except SystemExit as exc:
+        logger.error("El servidor termino durante el arranque (exit_code=%s)", exc.code)
 
 
-def _configure_telegram_webhook(public_base_url: str) -> None:
+async def _configure_telegram_webhook(public_base_url: str) -> None:
     if not settings.auto_set_webhook:
         logger.info("AUTO_SET_WEBHOOK=false. Se omite configuracion automatica.")
         return
@@ -41,26 +39,28 @@ def _configure_telegram_webhook(public_base_url: str) -> None:
 
     webhook_path = _normalize_webhook_path(settings.telegram_webhook_path)
     webhook_url = f"{public_base_url}{webhook_path}"
-    client = TelegramWebhookClient(
-        telegram_token=settings.telegram_token,
-        telegram_api_base_url=settings.telegram_api_base_url,
-    )
 
     logger.info("Configurando webhook en %s", webhook_url)
     try:
-        set_result = client.set_webhook(
-            webhook_url=webhook_url,
-            secret_token=settings.telegram_webhook_secret or None,
-            drop_pending_updates=settings.drop_pending_updates,
-        )
-        if not set_result.get("ok"):
-            logger.error("setWebhook devolvio error: %s", set_result)
-            return
-
-        info_result = client.get_webhook_info()
-        if not info_result.get("ok"):
-            logger.error("getWebhookInfo devolvio error: %s", info_result)
-            return
+        async with httpx.AsyncClient(timeout=20.0) as http_client:
+            client = AsyncTelegramWebhookClient(
+                telegram_token=settings.telegram_token,
+                telegram_api_base_url=settings.telegram_api_base_url,
+                http_client=http_client,
+            )
+            set_result = await client.set_webhook(
+                webhook_url=webhook_url,
+                secret_token=settings.telegram_webhook_secret or None,
+                drop_pending_updates=settings.drop_pending_updates,
+            )
+            if not set_result.get("ok"):
+                logger.error("setWebhook devolvio error: %s", set_result)
+                return
+
+            info_result = await client.get_webhook_info()
+            if not info_result.get("ok"):
+                logger.error("getWebhookInfo devolvio error: %s", info_result)
+                return
 
         info = info_result.get("result", {})
         logger.info("Webhook configurado. pending_update_count=%s", info.get("pending_update_count"))
@@ -70,10 +70,26 @@ def _configure_telegram_webhook(public_base_url: str) -> None:
         logger.exception("Error HTTP configurando webhook de Telegram")
 
 
-def main() -> int:
-    logger.info("Iniciando servidor unico con ngrok + webhook automatico")
-    logger.info("Config server: host=%s port=%s", settings.server_host, settings.server_port)
+async def _start_ngrok_tunnel(start_http_tunnel: Callable[..., str]) -> str:
+    public_url = await asyncio.to_thread(
+        start_http_tunnel,
+        port=settings.server_port,
+        domain=settings.ngrok_domain,
+    )
+    logger.info("Tunnel ngrok activo: %s", public_url)
+    return public_url
+
 
+async def _stop_server(server: ReadyServer, server_task: asyncio.Task[None]) -> None:
+    server.should_exit = True
+    try:
+        await asyncio.wait_for(server_task, timeout=10.0)
+    except asyncio.TimeoutError:
+        logger.warning("El servidor no termino a tiempo.")
+
+
+async def _run() -> int:
+    orchestrator = StartupOrchestrator(logger)
     config = uvicorn.Config(
         app=app,
         host=settings.server_host,
@@ -82,57 +98,72 @@ def main() -> int:
         proxy_headers=settings.proxy_headers_enabled,
         forwarded_allow_ips=settings.forwarded_allow_ips,
     )
-    server = uvicorn.Server(config)
-
-    server_thread = threading.Thread(target=server.run, name="uvicorn-server", daemon=True)
-    server_thread.start()
-
-    if not _wait_for_server_started(server, server_thread):
-        logger.error("El servidor no estuvo listo a tiempo. Abortando.")
-        server.should_exit = True
-        server_thread.join(timeout=5.0)
-        return 1
-
-    logger.info("Servidor listo en http://127.0.0.1:%s", settings.server_port)
+    server = ReadyServer(config)
+    server_task = asyncio.create_task(_serve(server), name="uvicorn-server")
 
     ngrok_service = None
+    if settings.telegram_ingestion_mode == "polling":
+        logger.info("TELEGRAM_INGESTION_MODE=polling. Se omiten tunel ngrok y setWebhook.")
+    elif settings.ngrok_enabled:
+        try:
+            from src.infrastructure.pyngrok.ngrok_service import NgrokService
+        except ModuleNotFoundError:
+            logger.error("No se encontro pyngrok. Instala dependencia: pip install pyngrok")
+            await _stop_server(server, server_task)
+            return 1
+        ngrok_service = NgrokService(auth_token=settings.ngrok_authtoken)
+    else:
+        logger.info("NGROK_ENABLED=false. Se omite tunel ngrok.")
+
+    warm_up_task = asyncio.create_task(
+        orchestrator.run_step("telegram_warm_up", app.state.telegram_api_client.warm_up())
+    )
+    tunnel_task = (
+        asyncio.create_task(orchestrator.run_step("ngrok_tunnel", _start_ngrok_tunnel(ngrok_service.start_http_tunnel)))
+        if ngrok_service is not None
+        else None
+    )
+
     try:
-        if settings.ngrok_enabled:
+        is_ready = await orchestrator.run_step("server_boot", server.wait_until_ready(server_task))
+        if not is_ready:
+            logger.error("El servidor no estuvo listo a tiempo. Abortando.")
+            return 1
+        logger.info("Servidor listo en http://127.0.0.1:%s", settings.server_port)
+
+        if tunnel_task is not None:
             try:
-                from src.infrastructure.pyngrok.ngrok_service import NgrokService
-            except ModuleNotFoundError:
-                logger.error("No se encontro pyngrok. Instala dependencia: pip install pyngrok")
-                server.should_exit = True
-                server_thread.join(timeout=5.0)
+                public_url = await tunnel_task
+            except Exception:
+                logger.exception("Fallo inicializando ngrok y/o webhook")
                 return 1
+            await orchestrator.run_step("telegram_webhook", _configure_telegram_webhook(public_url))
 
-            ngrok_service = NgrokService(auth_token=settings.ngrok_authtoken)
-            public_url = ngrok_service.start_http_tunnel(
-                port=settings.server_port,
-                domain=settings.ngrok_domain,
-            )
-            logger.info("Tunnel ngrok activo: %s", public_url)
-            _configure_telegram_webhook(public_url)
-        else:
-            logger.info("NGROK_ENABLED=false. Se omite tunel ngrok.")
-    except Exception:
-        logger.exception("Fallo inicializando ngrok y/o webhook")
-        server.should_exit = True
-        server_thread.join(timeout=5.0)
-        return 1
-
-    try:
-        while server_thread.is_alive():
-            server_thread.join(timeout=0.5)
-    except KeyboardInterrupt:
-        logger.info("Interrupcion recibida. Cerrando servicios...")
+        await asyncio.gather(warm_up_task, return_exceptions=True)
+        orchestrator.log_summary()
+        await server_task
+        return 0
     finally:
+        for pending_task in (warm_up_task, tunnel_task):
+            if pending_task is not None and not pending_task.done():
+                pending_task.cancel()
         if ngrok_service is not None:
             ngrok_service.stop()
-        server.should_exit = True
-        server_thread.join(timeout=10.0)
+        if not server_task.done():
+            await _stop_server(server, server_task)
+
 
-    return 0
+def main() -> int:
+    if settings.telegram_ingestion_mode == "polling":
+        logger.info("Iniciando servidor unico con ingesta por getUpdates")
+    else:
+        logger.info("Iniciando servidor unico con ngrok + webhook automatico")
+    logger.info("Config server: host=%s port=%s", settings.server_host, settings.server_port)
+    try:
+        return asyncio.run(_run())
+    except KeyboardInterrupt:
+        logger.info("Interrupcion recibida. Servicios cerrados.")
+        return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ChatRecord:
+    chat_id: int
+    chat_type: str | None = None
+    title: str | None = None
+    last_seen_at: datetime | None = None
+    subscriptions: frozenset[str] = field(default_factory=frozenset)
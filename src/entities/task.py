@@ -23,3 +23,8 @@ class StartedTask:  # pylint: disable=too-many-instance-attributes
     execution_time_seconds: float | None = None
     start_datetime: datetime | None = None
     end_datetime: datetime | None = None
+    subscriber_chat_ids: tuple[int, ...] = ()
+
+    @property
+    def recipient_chat_ids(self) -> tuple[int, ...]:
+        return (self.chat_id, *(chat_id for chat_id in self.subscriber_chat_ids if chat_id != self.chat_id))
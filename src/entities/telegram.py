@@ -1,19 +1,36 @@
 from typing import Any, Optional
 
 
-def extract_chat_id(update: dict[str, Any]) -> Optional[int]:
-    message = update.get("message") or update.get("edited_message")
+def _chat_from_message(message: Any) -> Optional[dict[str, Any]]:
     if isinstance(message, dict):
         chat = message.get("chat")
         if isinstance(chat, dict) and isinstance(chat.get("id"), int):
-            return chat["id"]
+            return chat
+    return None
+
+
+def extract_chat(update: dict[str, Any]) -> Optional[dict[str, Any]]:
+    chat = _chat_from_message(update.get("message") or update.get("edited_message"))
+    if chat is not None:
+        return chat
 
     callback_query = update.get("callback_query")
     if isinstance(callback_query, dict):
-        callback_message = callback_query.get("message")
-        if isinstance(callback_message, dict):
-            chat = callback_message.get("chat")
-            if isinstance(chat, dict) and isinstance(chat.get("id"), int):
-                return chat["id"]
+        return _chat_from_message(callback_query.get("message"))
+
+    return None
+
+
+def extract_chat_id(update: dict[str, Any]) -> Optional[int]:
+    chat = extract_chat(update)
+    if chat is None:
+        return None
+    return chat["id"]
+
 
+def chat_display_title(chat: dict[str, Any]) -> Optional[str]:
+    for key in ("title", "username", "first_name"):
+        value = chat.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
     return None
@@ -0,0 +1,32 @@
+import threading
+
+
+class RecentUpdateIdWindow:
+    def __init__(self, size: int = 1024) -> None:
+        self._size = max(size, 1)
+        self._mask = (1 << self._size) - 1
+        self._high_water_mark: int | None = None
+        self._seen_bits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def high_water_mark(self) -> int | None:
+        return self._high_water_mark
+
+    def check_and_mark(self, update_id: int) -> bool:
+        with self._lock:
+            if self._high_water_mark is None or update_id > self._high_water_mark:
+                shift = self._size if self._high_water_mark is None else update_id - self._high_water_mark
+                self._seen_bits = ((self._seen_bits << shift) | 1) & self._mask if shift < self._size else 1
+                self._high_water_mark = update_id
+                return False
+
+            offset = self._high_water_mark - update_id
+            if offset >= self._size:
+                return True
+
+            bit = 1 << offset
+            if self._seen_bits & bit:
+                return True
+            self._seen_bits |= bit
+            return False
@@ -1,6 +1,9 @@
+import asyncio
 import os
 import hashlib
 import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from uuid import uuid4
 from typing import Any
 
@@ -9,6 +12,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.entities.telegram_update_window import RecentUpdateIdWindow
 from src.infrastructure.fastapi.contact_router import create_contact_router
 from src.infrastructure.fastapi.health_router import create_health_router
 from src.infrastructure.fastapi.request_metadata import get_client_ip, get_x_forwarded_for
@@ -21,7 +25,9 @@ from src.infrastructure.request_id.context_request_id_provider import (
     set_request_id,
 )
 from src.infrastructure.httpx.telegram_api_client import TelegramApiClient
+from src.infrastructure.httpx.telegram_update_poller import TelegramUpdatePoller
 from src.infrastructure.smtp.smtp_mail_gateway import SmtpMailGateway
+from src.infrastructure.sqlite.sqlite_chat_registry_gateway import SqliteChatRegistryGateway
 from src.interface_adapters.controllers.health_controller import HealthController
 from src.interface_adapters.controllers.tasks_controller import TasksController
 from src.interface_adapters.controllers.telegram_controller import TelegramController
@@ -115,8 +121,27 @@ def _log_environment_configuration(app_settings: Settings) -> None:
         logger.warning("APP_ENV=%s; se recomienda production en entorno productivo.", app_settings.app_env)
 
 
+def _build_chat_registry(effective_settings: Settings) -> SqliteChatRegistryGateway:
+    registry_path = effective_settings.chat_registry_path or effective_settings.state_file_path.with_name(
+        ".chat_registry.sqlite3"
+    )
+    chat_registry = SqliteChatRegistryGateway(
+        registry_path,
+        logger,
+        write_behind=effective_settings.chat_state_write_behind,
+        debounce_seconds=effective_settings.chat_state_debounce_seconds,
+        fsync=effective_settings.chat_state_fsync,
+    )
+    if chat_registry.get_last_chat_id() is None and effective_settings.state_file_path.exists():
+        legacy_chat_id = FileChatStateGateway(effective_settings.state_file_path, logger).get_last_chat_id()
+        if legacy_chat_id is not None:
+            logger.info("Migrando last_chat_id legacy al registro de chats: %s", legacy_chat_id)
+            chat_registry.set_last_chat_id(legacy_chat_id)
+    return chat_registry
+
+
 def _build_dependencies(effective_settings: Settings) -> dict[str, Any]:
-    chat_state_gateway = FileChatStateGateway(effective_settings.state_file_path, logger)
+    chat_state_gateway = _build_chat_registry(effective_settings)
     telegram_api_client = TelegramApiClient(
         token=effective_settings.telegram_token,
         base_url=effective_settings.telegram_api_base_url,
@@ -130,6 +155,12 @@ def _build_dependencies(effective_settings: Settings) -> dict[str, Any]:
         logger=logger,
         debug_enabled=effective_settings.debug_telegram_webhook,
         mask_sensitive_ids=effective_settings.mask_sensitive_ids,
+        chat_registry_gateway=chat_state_gateway,
+        update_window=(
+            RecentUpdateIdWindow(effective_settings.telegram_update_dedup_window)
+            if effective_settings.telegram_update_dedup_window > 0
+            else None
+        ),
     )
     get_last_chat_use_case = GetLastChatUseCase(chat_state_gateway=chat_state_gateway, logger=logger)
     start_task_use_case = StartTaskUseCase(
@@ -138,6 +169,7 @@ def _build_dependencies(effective_settings: Settings) -> dict[str, Any]:
         logger=logger,
         repository_name=effective_settings.repository_name,
         fallback_chat_id=effective_settings.telegram_chat_id,
+        chat_registry_gateway=chat_state_gateway,
     )
     mail_gateway = SmtpMailGateway(
         host=effective_settings.smtp_host,
@@ -162,6 +194,18 @@ def _build_dependencies(effective_settings: Settings) -> dict[str, Any]:
         rate_limit_max=effective_settings.rate_limit_max,
     )
     get_health_use_case = GetHealthUseCase(service_name=_SERVICE_NAME, logger=logger)
+    telegram_update_poller = None
+    if effective_settings.telegram_ingestion_mode == "polling":
+        if effective_settings.telegram_token:
+            telegram_update_poller = TelegramUpdatePoller(
+                telegram_api_client=telegram_api_client,
+                process_webhook_use_case=process_webhook_use_case,
+                offset_gateway=chat_state_gateway,
+                logger=logger,
+                timeout_seconds=effective_settings.telegram_polling_timeout_seconds,
+            )
+        else:
+            logger.warning("TELEGRAM_INGESTION_MODE=polling sin TELEGRAM_TOKEN. Se omite getUpdates.")
     return {
         "send_mail_use_case": send_mail_use_case,
         "submit_contact_use_case": submit_contact_use_case,
@@ -172,9 +216,29 @@ def _build_dependencies(effective_settings: Settings) -> dict[str, Any]:
         ),
         "tasks_controller": TasksController(start_task_use_case=start_task_use_case),
         "start_task_use_case": start_task_use_case,
+        "telegram_api_client": telegram_api_client,
+        "chat_state_gateway": chat_state_gateway,
+        "telegram_update_poller": telegram_update_poller,
     }
 
 
+def _build_lifespan(dependencies: dict[str, Any]) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        telegram_update_poller = dependencies["telegram_update_poller"]
+        if telegram_update_poller is not None:
+            telegram_update_poller.start()
+        try:
+            yield
+        finally:
+            if telegram_update_poller is not None:
+                await telegram_update_poller.stop()
+            await asyncio.to_thread(dependencies["chat_state_gateway"].close)
+            await dependencies["telegram_api_client"].aclose()
+
+    return lifespan
+
+
 def _register_middlewares(fastapi_app: FastAPI, effective_settings: Settings) -> None:
     @fastapi_app.middleware("http")
     async def request_id_middleware(request: Request, call_next: Any) -> JSONResponse:
@@ -323,7 +387,7 @@ def create_app(custom_settings: Settings | None = None) -> FastAPI:
 
     dependencies = _build_dependencies(effective_settings)
 
-    fastapi_app = FastAPI(title="Datamaq Communications API")
+    fastapi_app = FastAPI(title="Datamaq Communications API", lifespan=_build_lifespan(dependencies))
     fastapi_app.add_middleware(
         CORSMiddleware,
         allow_origins=list(effective_settings.cors_allowed_origins),
@@ -335,6 +399,7 @@ def create_app(custom_settings: Settings | None = None) -> FastAPI:
 
     fastapi_app.state.send_mail_use_case = dependencies["send_mail_use_case"]
     fastapi_app.state.submit_contact_use_case = dependencies["submit_contact_use_case"]
+    fastapi_app.state.telegram_api_client = dependencies["telegram_api_client"]
     fastapi_app.include_router(create_health_router(dependencies["health_controller"]))
     fastapi_app.include_router(create_telegram_router(dependencies["telegram_controller"]))
     fastapi_app.include_router(
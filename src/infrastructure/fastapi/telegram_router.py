@@ -1,25 +1,51 @@
 from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
 
 from src.interface_adapters.controllers.telegram_controller import TelegramController
+from src.shared import json_codec
 from src.use_cases.errors import InvalidTelegramSecretError
 
+_SECRET_HEADER = "x-telegram-bot-api-secret-token"
+_MAX_UPDATE_BYTES = 1024 * 1024
+
+
+def _parse_update(raw_body: bytes) -> dict[str, Any] | None:
+    try:
+        update = json_codec.loads(raw_body)
+    except ValueError:
+        return None
+    if not isinstance(update, dict):
+        return None
+    return update
+
 
 def create_telegram_router(telegram_controller: TelegramController) -> APIRouter:
     router = APIRouter()
 
-    @router.post("/telegram/webhook")
-    async def telegram_webhook(
-        update: dict[str, Any],
-        request: Request,
-        x_telegram_bot_api_secret_token: str | None = Header(default=None),
-    ) -> dict[str, Any]:
+    @router.post("/telegram/webhook", response_model=None)
+    async def telegram_webhook(request: Request) -> dict[str, Any] | JSONResponse:
+        request_id = getattr(request.state, "request_id", "")
+        provided_secret = request.headers.get(_SECRET_HEADER)
         try:
-            request_id = getattr(request.state, "request_id", "")
-            return telegram_controller.handle_webhook(update, x_telegram_bot_api_secret_token, request_id=request_id)
+            telegram_controller.authorize_webhook(provided_secret, request_id=request_id)
         except InvalidTelegramSecretError as exc:
-            raise HTTPException(status_code=403, detail=str(exc)) from exc
+            return JSONResponse(status_code=403, content={"detail": str(exc)})
+
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > _MAX_UPDATE_BYTES:
+            raise HTTPException(status_code=413, detail="Telegram update payload too large")
+
+        update = _parse_update(await request.body())
+        if update is None:
+            raise HTTPException(status_code=422, detail="Invalid Telegram update payload")
+
+        return telegram_controller.handle_authorized_webhook(
+            update,
+            request_id=request_id,
+            has_secret_header=bool(provided_secret),
+        )
 
     @router.get("/telegram/last_chat")
     async def telegram_last_chat() -> dict[str, Any]:
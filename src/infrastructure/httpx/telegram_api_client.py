@@ -1,4 +1,5 @@
 import logging
+from typing import Any
 
 import httpx
 
@@ -15,6 +16,83 @@ class TelegramApiClient:
         self._base_url = base_url.rstrip("/")
         self._logger = logger
         self._timeout_seconds = timeout_seconds
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or getattr(self._client, "is_closed", False):
+            self._client = httpx.AsyncClient(timeout=self._timeout_seconds)
+        return self._client
+
+    async def warm_up(self) -> bool:
+        if not self._token:
+            self._logger.info("TELEGRAM_TOKEN no configurado. Se omite warm-up de Telegram.")
+            return False
+
+        url = f"{self._base_url}/bot{self._token}/getMe"
+        try:
+            response = await self._get_client().get(url)
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError:
+            self._logger.exception("Error en warm-up de Telegram getMe")
+            return False
+
+        if not data.get("ok"):
+            self._logger.error("Telegram getMe devolvio error: %s", data)
+            return False
+        self._logger.info("Conexion con Telegram lista. bot=%s", data.get("result", {}).get("username"))
+        return True
+
+    async def delete_webhook(self, drop_pending_updates: bool = False) -> bool:
+        if not self._token:
+            self._logger.error("TELEGRAM_TOKEN no configurado. No se puede eliminar webhook.")
+            return False
+
+        url = f"{self._base_url}/bot{self._token}/deleteWebhook"
+        try:
+            response = await self._get_client().post(url, json={"drop_pending_updates": drop_pending_updates})
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError:
+            self._logger.exception("Error llamando a Telegram deleteWebhook")
+            return False
+
+        if not data.get("ok"):
+            self._logger.error("Telegram deleteWebhook devolvio error: %s", data)
+            return False
+        return True
+
+    async def get_updates(
+        self, offset: int | None, timeout_seconds: int, limit: int = 100
+    ) -> list[dict[str, Any]] | None:
+        if not self._token:
+            self._logger.error("TELEGRAM_TOKEN no configurado. No se puede consultar getUpdates.")
+            return None
+
+        url = f"{self._base_url}/bot{self._token}/getUpdates"
+        payload: dict[str, Any] = {"timeout": timeout_seconds, "limit": limit}
+        if offset is not None:
+            payload["offset"] = offset
+        try:
+            response = await self._get_client().post(url, json=payload, timeout=self._timeout_seconds + timeout_seconds)
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError:
+            self._logger.exception("Error llamando a Telegram getUpdates")
+            return None
+
+        if not data.get("ok"):
+            self._logger.error("Telegram getUpdates devolvio error: %s", data)
+            return None
+        result = data.get("result")
+        if not isinstance(result, list):
+            return []
+        return [update for update in result if isinstance(update, dict)]
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_message(self, chat_id: int, text: str) -> None:
         if not self._token:
@@ -23,19 +101,17 @@ class TelegramApiClient:
 
         url = f"{self._base_url}/bot{self._token}/sendMessage"
         payload = {"chat_id": chat_id, "text": text}
-
         try:
-            async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                self._logger.info("Respuesta Telegram sendMessage status=%s", response.status_code)
-                if not data.get("ok"):
-                    self._logger.error("Telegram API devolvio error: %s", data)
-                else:
-                    self._logger.info(
-                        "Mensaje enviado correctamente. message_id=%s",
-                        data.get("result", {}).get("message_id"),
-                    )
+            response = await self._get_client().post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            self._logger.info("Respuesta Telegram sendMessage status=%s", response.status_code)
+            if not data.get("ok"):
+                self._logger.error("Telegram API devolvio error: %s", data)
+            else:
+                self._logger.info(
+                    "Mensaje enviado correctamente. message_id=%s",
+                    data.get("result", {}).get("message_id"),
+                )
         except httpx.HTTPError:
             self._logger.exception("Error llamando a Telegram sendMessage")
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from uuid import uuid4
+
+from src.infrastructure.httpx.telegram_api_client import TelegramApiClient
+from src.use_cases.ports import TelegramUpdateOffsetGateway
+from src.use_cases.process_telegram_webhook import ProcessTelegramWebhookUseCase
+
+
+class TelegramUpdatePoller:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        telegram_api_client: TelegramApiClient,
+        process_webhook_use_case: ProcessTelegramWebhookUseCase,
+        offset_gateway: TelegramUpdateOffsetGateway,
+        logger: logging.Logger,
+        timeout_seconds: int = 30,
+        batch_limit: int = 100,
+        max_backoff_seconds: float = 30.0,
+    ) -> None:
+        self._telegram_api_client = telegram_api_client
+        self._process_webhook_use_case = process_webhook_use_case
+        self._offset_gateway = offset_gateway
+        self._logger = logger
+        self._timeout_seconds = max(timeout_seconds, 0)
+        self._batch_limit = min(max(batch_limit, 1), 100)
+        self._max_backoff_seconds = max_backoff_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="telegram-update-poller")
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def run(self) -> None:
+        if not await self._telegram_api_client.delete_webhook(drop_pending_updates=False):
+            self._logger.warning("No se pudo eliminar webhook previo. getUpdates puede devolver conflicto.")
+
+        offset = self._offset_gateway.get_update_offset()
+        self._logger.info(
+            "telegram_polling_started",
+            extra={"event": "telegram_polling_started", "offset": offset, "timeout_seconds": self._timeout_seconds},
+        )
+        backoff_seconds = 1.0
+        while True:
+            updates = await self._telegram_api_client.get_updates(
+                offset=offset,
+                timeout_seconds=self._timeout_seconds,
+                limit=self._batch_limit,
+            )
+            if updates is None:
+                await asyncio.sleep(backoff_seconds)
+                backoff_seconds = min(backoff_seconds * 2, self._max_backoff_seconds)
+                continue
+
+            backoff_seconds = 1.0
+            if updates:
+                offset = self.process_batch(updates, offset)
+
+    def process_batch(self, updates: list[dict], offset: int | None) -> int | None:
+        request_id = f"poll-{uuid4()}"
+        next_offset = offset
+        for update in updates:
+            update_id = update.get("update_id")
+            if isinstance(update_id, int) and (next_offset is None or update_id >= next_offset):
+                next_offset = update_id + 1
+            try:
+                self._process_webhook_use_case.process_update(update, request_id=request_id)
+            except Exception:
+                self._logger.exception(
+                    "telegram_polling_update_failed",
+                    extra={"event": "telegram_polling_update_failed", "request_id": request_id, "update_id": update_id},
+                )
+
+        if next_offset is not None and next_offset != offset:
+            self._offset_gateway.set_update_offset(next_offset)
+        self._logger.debug(
+            "telegram_polling_batch",
+            extra={
+                "event": "telegram_polling_batch",
+                "request_id": request_id,
+                "update_count": len(updates),
+                "offset": next_offset,
+            },
+        )
+        return next_offset
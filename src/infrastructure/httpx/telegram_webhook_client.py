@@ -34,3 +34,34 @@ class TelegramWebhookClient:
             response = client.get(endpoint)
             response.raise_for_status()
             return response.json()
+
+
+class AsyncTelegramWebhookClient:
+    def __init__(self, telegram_token: str, telegram_api_base_url: str, http_client: httpx.AsyncClient) -> None:
+        self._telegram_token = telegram_token.strip()
+        self._telegram_api_base_url = telegram_api_base_url.rstrip("/")
+        self._http_client = http_client
+
+    async def set_webhook(
+        self,
+        webhook_url: str,
+        secret_token: str | None,
+        drop_pending_updates: bool,
+    ) -> dict[str, Any]:
+        endpoint = f"{self._telegram_api_base_url}/bot{self._telegram_token}/setWebhook"
+        payload: dict[str, Any] = {
+            "url": webhook_url,
+            "drop_pending_updates": str(drop_pending_updates).lower(),
+        }
+        if secret_token:
+            payload["secret_token"] = secret_token
+
+        response = await self._http_client.post(endpoint, data=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_webhook_info(self) -> dict[str, Any]:
+        endpoint = f"{self._telegram_api_base_url}/bot{self._telegram_token}/getWebhookInfo"
+        response = await self._http_client.get(endpoint)
+        response.raise_for_status()
+        return response.json()
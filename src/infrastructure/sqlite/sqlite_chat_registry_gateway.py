@@ -0,0 +1,286 @@
+from dataclasses import replace
+from datetime import datetime
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+
+from src.entities.chat import ChatRecord
+from src.shared.datetime_utils import to_utc_iso
+from src.shared.write_behind import WriteBehindFlusher
+from src.use_cases.ports import ChatRegistryGateway, ChatStateGateway, TelegramUpdateOffsetGateway
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chats (
+    chat_id INTEGER PRIMARY KEY,
+    chat_type TEXT,
+    title TEXT,
+    last_seen_at TEXT
+);
+CREATE TABLE IF NOT EXISTS chat_subscriptions (
+    chat_id INTEGER NOT NULL,
+    repository TEXT NOT NULL,
+    PRIMARY KEY (chat_id, repository)
+);
+CREATE INDEX IF NOT EXISTS idx_chat_subscriptions_repository ON chat_subscriptions (repository);
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_UPSERT_CHAT_SQL = """
+INSERT INTO chats (chat_id, chat_type, title, last_seen_at) VALUES (?, ?, ?, ?)
+ON CONFLICT(chat_id) DO UPDATE SET
+    chat_type = excluded.chat_type,
+    title = excluded.title,
+    last_seen_at = excluded.last_seen_at
+"""
+
+_UPSERT_META_SQL = """
+INSERT INTO registry_meta (key, value) VALUES (?, ?)
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+# pylint: disable=too-many-instance-attributes
+class SqliteChatRegistryGateway(ChatStateGateway, ChatRegistryGateway, TelegramUpdateOffsetGateway):
+    def __init__(
+        self,
+        database_path: Path,
+        logger: logging.Logger,
+        write_behind: bool = True,
+        debounce_seconds: float = 1.0,
+        fsync: bool = False,
+    ) -> None:
+        self._database_path = database_path
+        self._logger = logger
+        self._fsync = fsync
+        self._state_lock = threading.Lock()
+        self._connection_lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._chats: dict[int, ChatRecord] = {}
+        self._subscribers_by_repository: dict[str, set[int]] = {}
+        self._last_chat_id: int | None = None
+        self._dirty_chat_ids: set[int] = set()
+        self._last_chat_dirty = False
+        self._update_offset: int | None = None
+        self._update_offset_dirty = False
+        self._flusher = (
+            WriteBehindFlusher(
+                flush_callback=self._flush_dirty,
+                debounce_seconds=debounce_seconds,
+                logger=logger,
+                name="chat-registry-writer",
+            )
+            if write_behind
+            else None
+        )
+        self._load_from_database()
+
+    def get_last_chat_id(self) -> int | None:
+        with self._state_lock:
+            return self._last_chat_id
+
+    def set_last_chat_id(self, chat_id: int) -> None:
+        with self._state_lock:
+            if self._last_chat_id == chat_id:
+                return
+            self._last_chat_id = chat_id
+            self._last_chat_dirty = True
+            if chat_id not in self._chats:
+                self._chats[chat_id] = ChatRecord(chat_id=chat_id)
+                self._dirty_chat_ids.add(chat_id)
+        self._schedule_flush()
+
+    def get_update_offset(self) -> int | None:
+        with self._state_lock:
+            return self._update_offset
+
+    def set_update_offset(self, offset: int) -> None:
+        with self._state_lock:
+            if self._update_offset == offset:
+                return
+            self._update_offset = offset
+            self._update_offset_dirty = True
+        self._schedule_flush()
+
+    def record_chat(self, chat_id: int, chat_type: str | None, title: str | None, seen_at: datetime) -> None:
+        with self._state_lock:
+            current = self._chats.get(chat_id)
+            if current is None:
+                current = ChatRecord(chat_id=chat_id)
+            self._chats[chat_id] = replace(
+                current,
+                chat_type=chat_type or current.chat_type,
+                title=title or current.title,
+                last_seen_at=seen_at,
+            )
+            self._dirty_chat_ids.add(chat_id)
+        self._schedule_flush()
+
+    def get_chat(self, chat_id: int) -> ChatRecord | None:
+        with self._state_lock:
+            return self._chats.get(chat_id)
+
+    def list_chats(self) -> list[ChatRecord]:
+        with self._state_lock:
+            return list(self._chats.values())
+
+    def subscribe(self, chat_id: int, repository: str) -> bool:
+        clean_repository = repository.strip()
+        if not clean_repository:
+            return False
+
+        with self._state_lock:
+            current = self._chats.get(chat_id) or ChatRecord(chat_id=chat_id)
+            if clean_repository in current.subscriptions:
+                return False
+            self._chats[chat_id] = replace(current, subscriptions=current.subscriptions | {clean_repository})
+            self._subscribers_by_repository.setdefault(clean_repository, set()).add(chat_id)
+            self._dirty_chat_ids.add(chat_id)
+        self._schedule_flush()
+        return True
+
+    def unsubscribe(self, chat_id: int, repository: str) -> bool:
+        clean_repository = repository.strip()
+        with self._state_lock:
+            current = self._chats.get(chat_id)
+            if current is None or clean_repository not in current.subscriptions:
+                return False
+            self._chats[chat_id] = replace(current, subscriptions=current.subscriptions - {clean_repository})
+            subscribers = self._subscribers_by_repository.get(clean_repository, set())
+            subscribers.discard(chat_id)
+            if not subscribers:
+                self._subscribers_by_repository.pop(clean_repository, None)
+            self._dirty_chat_ids.add(chat_id)
+        self._schedule_flush()
+        return True
+
+    def subscribers_for(self, repository: str) -> tuple[int, ...]:
+        with self._state_lock:
+            return tuple(sorted(self._subscribers_by_repository.get(repository.strip(), ())))
+
+    def flush(self) -> None:
+        if self._flusher is not None:
+            self._flusher.flush()
+
+    def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.close()
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _schedule_flush(self) -> None:
+        if self._flusher is not None:
+            self._flusher.mark_dirty()
+            return
+        self._flush_dirty()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._database_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._database_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={'FULL' if self._fsync else 'NORMAL'}")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _load_from_database(self) -> None:
+        if not self._database_path.exists():
+            self._logger.info("No se encontro registro de chats en %s", self._database_path)
+            return
+
+        try:
+            with self._connection_lock:
+                connection = self._get_connection()
+                chat_rows = connection.execute("SELECT chat_id, chat_type, title, last_seen_at FROM chats").fetchall()
+                subscription_rows = connection.execute("SELECT chat_id, repository FROM chat_subscriptions").fetchall()
+                meta_rows = dict(connection.execute("SELECT key, value FROM registry_meta").fetchall())
+        except sqlite3.Error:
+            self._logger.exception("No se pudo leer registro de chats en %s", self._database_path)
+            return
+
+        subscriptions_by_chat: dict[int, set[str]] = {}
+        for chat_id, repository in subscription_rows:
+            subscriptions_by_chat.setdefault(chat_id, set()).add(repository)
+            self._subscribers_by_repository.setdefault(repository, set()).add(chat_id)
+
+        for chat_id, chat_type, title, last_seen_at in chat_rows:
+            self._chats[chat_id] = ChatRecord(
+                chat_id=chat_id,
+                chat_type=chat_type,
+                title=title,
+                last_seen_at=_parse_datetime(last_seen_at),
+                subscriptions=frozenset(subscriptions_by_chat.get(chat_id, ())),
+            )
+
+        for key in ("last_chat_id", "telegram_update_offset"):
+            if key not in meta_rows:
+                continue
+            try:
+                value = int(meta_rows[key])
+            except ValueError:
+                self._logger.warning("%s invalido en registro de chats %s", key, self._database_path)
+                continue
+            if key == "last_chat_id":
+                self._last_chat_id = value
+            else:
+                self._update_offset = value
+        self._logger.info("Registro de chats restaurado. chats=%s", len(self._chats))
+
+    def _flush_dirty(self) -> None:
+        with self._state_lock:
+            records = [self._chats[chat_id] for chat_id in self._dirty_chat_ids if chat_id in self._chats]
+            write_last_chat = self._last_chat_dirty
+            last_chat_id = self._last_chat_id
+            write_update_offset = self._update_offset_dirty
+            update_offset = self._update_offset
+            self._dirty_chat_ids.clear()
+            self._last_chat_dirty = False
+            self._update_offset_dirty = False
+
+        if not records and not write_last_chat and not write_update_offset:
+            return
+
+        try:
+            with self._connection_lock:
+                connection = self._get_connection()
+                with connection:
+                    connection.executemany(
+                        _UPSERT_CHAT_SQL,
+                        [
+                            (record.chat_id, record.chat_type, record.title, to_utc_iso(record.last_seen_at))
+                            for record in records
+                        ],
+                    )
+                    connection.executemany(
+                        "DELETE FROM chat_subscriptions WHERE chat_id = ?",
+                        [(record.chat_id,) for record in records],
+                    )
+                    connection.executemany(
+                        "INSERT INTO chat_subscriptions (chat_id, repository) VALUES (?, ?)",
+                        [(record.chat_id, repository) for record in records for repository in record.subscriptions],
+                    )
+                    if write_last_chat and last_chat_id is not None:
+                        connection.execute(_UPSERT_META_SQL, ("last_chat_id", str(last_chat_id)))
+                    if write_update_offset and update_offset is not None:
+                        connection.execute(_UPSERT_META_SQL, ("telegram_update_offset", str(update_offset)))
+        except sqlite3.Error:
+            self._logger.exception("No se pudo persistir registro de chats en %s", self._database_path)
+            with self._state_lock:
+                self._dirty_chat_ids.update(record.chat_id for record in records)
+                self._last_chat_dirty = self._last_chat_dirty or write_last_chat
+                self._update_offset_dirty = self._update_offset_dirty or write_update_offset
@@ -0,0 +1 @@
+"""Startup orchestration."""
@@ -0,0 +1,62 @@
+import logging
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class StartupStepTiming:
+    name: str
+    duration_ms: float
+    ok: bool
+
+
+class StartupOrchestrator:
+    def __init__(self, logger: logging.Logger) -> None:
+        self._logger = logger
+        self._started_at = time.perf_counter()
+        self._timings: list[StartupStepTiming] = []
+
+    @property
+    def timings(self) -> tuple[StartupStepTiming, ...]:
+        return tuple(self._timings)
+
+    async def run_step(self, name: str, step: Awaitable[T]) -> T:
+        step_started_at = time.perf_counter()
+        try:
+            result = await step
+        except BaseException:
+            self._record(name, step_started_at, ok=False)
+            self._logger.exception(
+                "startup_step_failed",
+                extra={"event": "startup_step_failed", "step": name, "duration_ms": self._timings[-1].duration_ms},
+            )
+            raise
+
+        self._record(name, step_started_at, ok=True)
+        self._logger.info(
+            "startup_step_completed",
+            extra={"event": "startup_step_completed", "step": name, "duration_ms": self._timings[-1].duration_ms},
+        )
+        return result
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._started_at) * 1000, 2)
+
+    def log_summary(self) -> None:
+        self._logger.info(
+            "startup_completed",
+            extra={
+                "event": "startup_completed",
+                "total_ms": self.elapsed_ms(),
+                "steps_ms": {timing.name: timing.duration_ms for timing in self._timings},
+                "failed_steps": [timing.name for timing in self._timings if not timing.ok],
+            },
+        )
+
+    def _record(self, name: str, step_started_at: float, ok: bool) -> None:
+        duration_ms = round((time.perf_counter() - step_started_at) * 1000, 2)
+        self._timings.append(StartupStepTiming(name=name, duration_ms=duration_ms, ok=ok))
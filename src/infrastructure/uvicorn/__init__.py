@@ -0,0 +1 @@
+"""Uvicorn server integration."""
@@ -0,0 +1,27 @@
+import asyncio
+import socket
+
+import uvicorn
+
+
+class ReadyServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config) -> None:
+        super().__init__(config)
+        self._ready = asyncio.Event()
+
+    async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            self._ready.set()
+
+    async def wait_until_ready(self, server_task: asyncio.Future[object], timeout_seconds: float = 20.0) -> bool:
+        ready_waiter = asyncio.ensure_future(self._ready.wait())
+        try:
+            await asyncio.wait(
+                {ready_waiter, server_task},
+                timeout=timeout_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready_waiter.cancel()
+        return self._ready.is_set()
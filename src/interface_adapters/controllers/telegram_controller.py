@@ -27,5 +27,18 @@ class TelegramController:
         )
         return present_webhook_result(captured_chat_id)
 
+    def authorize_webhook(self, provided_secret: str | None, request_id: str = "") -> None:
+        self._process_webhook_use_case.verify_secret(provided_secret, request_id=request_id)
+
+    def handle_authorized_webhook(
+        self, update: dict[str, Any], request_id: str = "", has_secret_header: bool = False
+    ) -> dict[str, Any]:
+        captured_chat_id = self._process_webhook_use_case.process_update(
+            update=update,
+            request_id=request_id,
+            has_secret_header=has_secret_header,
+        )
+        return present_webhook_result(captured_chat_id)
+
     def handle_last_chat(self) -> dict[str, Any]:
         return present_last_chat(self._get_last_chat_use_case.execute())
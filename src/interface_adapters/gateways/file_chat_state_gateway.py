@@ -1,16 +1,36 @@
 import logging
+import os
 import threading
 from pathlib import Path
 
+from src.shared.write_behind import WriteBehindFlusher
 from src.use_cases.ports import ChatStateGateway
 
 
 class FileChatStateGateway(ChatStateGateway):
-    def __init__(self, state_file_path: Path, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        state_file_path: Path,
+        logger: logging.Logger,
+        write_behind: bool = False,
+        debounce_seconds: float = 1.0,
+        fsync: bool = False,
+    ) -> None:
         self._state_file_path = state_file_path
         self._state_lock = threading.Lock()
         self._last_chat_id: int | None = None
         self._logger = logger
+        self._fsync = fsync
+        self._flusher = (
+            WriteBehindFlusher(
+                flush_callback=self._persist_current_chat_id,
+                debounce_seconds=debounce_seconds,
+                logger=logger,
+                name="chat-state-writer",
+            )
+            if write_behind
+            else None
+        )
         self._load_last_chat_id_from_file()
 
     def get_last_chat_id(self) -> int | None:
@@ -19,9 +39,23 @@ class FileChatStateGateway(ChatStateGateway):
 
     def set_last_chat_id(self, chat_id: int) -> None:
         with self._state_lock:
+            if self._last_chat_id == chat_id:
+                return
             self._last_chat_id = chat_id
+
+        if self._flusher is not None:
+            self._flusher.mark_dirty()
+            return
         self._persist_last_chat_id(chat_id)
 
+    def flush(self) -> None:
+        if self._flusher is not None:
+            self._flusher.flush()
+
+    def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.close()
+
     def _load_last_chat_id_from_file(self) -> None:
         if not self._state_file_path.exists():
             self._logger.info("No se encontro archivo de estado de chat en %s", self._state_file_path)
@@ -32,7 +66,6 @@ class FileChatStateGateway(ChatStateGateway):
             if not raw_value:
                 self._logger.warning("Archivo de estado vacio en %s", self._state_file_path)
                 return
-
             chat_id = int(raw_value)
         except ValueError:
             self._logger.warning("Archivo de estado invalido en %s", self._state_file_path)
@@ -45,10 +78,20 @@ class FileChatStateGateway(ChatStateGateway):
             self._last_chat_id = chat_id
         self._logger.info("last_chat_id restaurado desde archivo: %s", chat_id)
 
+    def _persist_current_chat_id(self) -> None:
+        with self._state_lock:
+            chat_id = self._last_chat_id
+        if chat_id is not None:
+            self._persist_last_chat_id(chat_id)
+
     def _persist_last_chat_id(self, chat_id: int) -> None:
         temp_path = self._state_file_path.with_suffix(".tmp")
         try:
-            temp_path.write_text(str(chat_id), encoding="utf-8")
+            with temp_path.open("w", encoding="utf-8") as temp_file:
+                temp_file.write(str(chat_id))
+                if self._fsync:
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
             temp_path.replace(self._state_file_path)
             self._logger.info("last_chat_id persistido en archivo: %s", chat_id)
         except OSError:
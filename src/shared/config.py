@@ -24,6 +24,16 @@ def parse_int(value: str, default: int) -> int:
         return default
 
 
+def parse_float(value: str, default: float) -> float:
+    text = value.strip()
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
 def parse_csv(value: str) -> tuple[str, ...]:
     return tuple(item.strip() for item in value.split(",") if item.strip())
 
@@ -38,6 +48,16 @@ def parse_optional_int(value: str) -> int | None:
         return None
 
 
+def parse_optional_path(value: str, base_path: Path) -> Path | None:
+    text = value.strip()
+    if not text:
+        return None
+    path = Path(text)
+    if not path.is_absolute():
+        path = base_path / path
+    return path
+
+
 def load_env_file(env_path: Path) -> list[str]:
     if not env_path.exists():
         return []
@@ -96,6 +116,13 @@ class Settings:  # pylint: disable=too-many-instance-attributes
     debug_contact_observability: bool
     debug_telegram_webhook: bool
     mask_sensitive_ids: bool
+    chat_state_write_behind: bool = True
+    chat_state_debounce_seconds: float = 1.0
+    chat_state_fsync: bool = False
+    chat_registry_path: Path | None = None
+    telegram_update_dedup_window: int = 1024
+    telegram_ingestion_mode: str = "webhook"
+    telegram_polling_timeout_seconds: int = 30
 
 
 def validate_startup_settings(settings: Settings) -> None:  # pylint: disable=too-many-branches
@@ -129,6 +156,9 @@ def validate_startup_settings(settings: Settings) -> None:  # pylint: disable=to
     if settings.app_env == "production" and "*" in settings.cors_allowed_origins:
         raise RuntimeError("CORS wildcard is not allowed in production")
 
+    if settings.telegram_ingestion_mode not in {"webhook", "polling"}:
+        raise RuntimeError(f"TELEGRAM_INGESTION_MODE invalid: {settings.telegram_ingestion_mode}")
+
     if settings.proxy_headers_enabled and not settings.forwarded_allow_ips.strip():
         raise RuntimeError("FORWARDED_ALLOW_IPS is required when PROXY_HEADERS_ENABLED=true")
 
@@ -185,4 +215,11 @@ def load_settings() -> Settings:
         debug_contact_observability=parse_bool(os.getenv("DEBUG_CONTACT_OBSERVABILITY", "false"), False),
         debug_telegram_webhook=parse_bool(os.getenv("DEBUG_TELEGRAM_WEBHOOK", "false"), False),
         mask_sensitive_ids=parse_bool(os.getenv("MASK_SENSITIVE_IDS", "true"), True),
+        chat_state_write_behind=parse_bool(os.getenv("CHAT_STATE_WRITE_BEHIND", "true"), True),
+        chat_state_debounce_seconds=parse_float(os.getenv("CHAT_STATE_DEBOUNCE_SECONDS", "1.0"), 1.0),
+        chat_state_fsync=parse_bool(os.getenv("CHAT_STATE_FSYNC", "false"), False),
+        chat_registry_path=parse_optional_path(os.getenv("CHAT_REGISTRY_PATH", ""), project_root),
+        telegram_update_dedup_window=parse_int(os.getenv("TELEGRAM_UPDATE_DEDUP_WINDOW", "1024"), 1024),
+        telegram_ingestion_mode=os.getenv("TELEGRAM_INGESTION_MODE", "webhook").strip().lower() or "webhook",
+        telegram_polling_timeout_seconds=parse_int(os.getenv("TELEGRAM_POLLING_TIMEOUT_SECONDS", "30"), 30),
     )
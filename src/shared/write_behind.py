@@ -0,0 +1,62 @@
+from collections.abc import Callable
+import logging
+import threading
+
+
+class WriteBehindFlusher:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        flush_callback: Callable[[], None],
+        debounce_seconds: float,
+        logger: logging.Logger,
+        name: str = "write-behind",
+    ) -> None:
+        self._flush_callback = flush_callback
+        self._debounce_seconds = max(debounce_seconds, 0.0)
+        self._logger = logger
+        self._name = name
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._dirty = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def mark_dirty(self) -> None:
+        with self._condition:
+            self._dirty = True
+            if not self._closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                    self._thread.start()
+                self._condition.notify_all()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._condition:
+                if not self._dirty:
+                    return
+                self._dirty = False
+            try:
+                self._flush_callback()
+            except Exception:
+                self._logger.exception("write_behind_flush_failed", extra={"event": "write_behind_flush_failed"})
+
+    def close(self, timeout_seconds: float = 5.0) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout_seconds)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._dirty or self._closed)
+                if self._closed:
+                    return
+                self._condition.wait_for(lambda: self._closed, timeout=self._debounce_seconds)
+            self.flush()
@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import Protocol
 
+from src.entities.chat import ChatRecord
 from src.entities.contact import ContactMessage
 
 
@@ -9,6 +11,26 @@ class ChatStateGateway(Protocol):
     def set_last_chat_id(self, chat_id: int) -> None: ...
 
 
+class ChatRegistryGateway(Protocol):
+    def record_chat(self, chat_id: int, chat_type: str | None, title: str | None, seen_at: datetime) -> None: ...
+
+    def get_chat(self, chat_id: int) -> ChatRecord | None: ...
+
+    def list_chats(self) -> list[ChatRecord]: ...
+
+    def subscribe(self, chat_id: int, repository: str) -> bool: ...
+
+    def unsubscribe(self, chat_id: int, repository: str) -> bool: ...
+
+    def subscribers_for(self, repository: str) -> tuple[int, ...]: ...
+
+
+class TelegramUpdateOffsetGateway(Protocol):
+    def get_update_offset(self) -> int | None: ...
+
+    def set_update_offset(self, offset: int) -> None: ...
+
+
 class TelegramNotificationGateway(Protocol):
     async def send_message(self, chat_id: int, text: str) -> None: ...
 
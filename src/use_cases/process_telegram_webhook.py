@@ -1,13 +1,16 @@
+from datetime import datetime, timezone
+import hmac
 import logging
 from typing import Any
 
-from src.entities.telegram import extract_chat_id
+from src.entities.telegram import chat_display_title, extract_chat
+from src.entities.telegram_update_window import RecentUpdateIdWindow
 from src.shared.log_safety import mask_identifier
 from src.use_cases.errors import InvalidTelegramSecretError
-from src.use_cases.ports import ChatStateGateway
+from src.use_cases.ports import ChatRegistryGateway, ChatStateGateway
 
 
-class ProcessTelegramWebhookUseCase:
+class ProcessTelegramWebhookUseCase:  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         chat_state_gateway: ChatStateGateway,
@@ -15,9 +18,14 @@ class ProcessTelegramWebhookUseCase:
         logger: logging.Logger,
         debug_enabled: bool = False,
         mask_sensitive_ids: bool = True,
+        chat_registry_gateway: ChatRegistryGateway | None = None,
+        update_window: RecentUpdateIdWindow | None = None,
     ) -> None:
         self._chat_state_gateway = chat_state_gateway
+        self._chat_registry_gateway = chat_registry_gateway
+        self._update_window = update_window
         self._expected_secret = expected_secret.strip()
+        self._expected_secret_bytes = self._expected_secret.encode("utf-8")
         self._logger = logger
         self._debug_enabled = debug_enabled
         self._mask_sensitive_ids = mask_sensitive_ids
@@ -29,31 +37,59 @@ class ProcessTelegramWebhookUseCase:
             return str(chat_id)
         return mask_identifier(chat_id, prefix=2, suffix=2)
 
+    def _record_chat(self, chat: dict[str, Any]) -> None:
+        if self._chat_registry_gateway is None:
+            return
+        chat_type = chat.get("type")
+        self._chat_registry_gateway.record_chat(
+            chat_id=chat["id"],
+            chat_type=chat_type if isinstance(chat_type, str) else None,
+            title=chat_display_title(chat),
+            seen_at=datetime.now(timezone.utc),
+        )
+
+    def verify_secret(self, provided_secret: str | None, request_id: str = "", update_id: object = None) -> None:
+        if not self._expected_secret:
+            return
+        if provided_secret is not None and hmac.compare_digest(
+            provided_secret.encode("utf-8"), self._expected_secret_bytes
+        ):
+            return
+
+        self._logger.warning(
+            "telegram_webhook_rejected",
+            extra={
+                "event": "telegram_webhook_rejected",
+                "request_id": request_id,
+                "update_id": update_id,
+                "reason": "invalid_secret",
+                "has_secret_header": bool(provided_secret),
+            },
+        )
+        raise InvalidTelegramSecretError("Invalid Telegram secret token")
+
     def execute(self, update: dict[str, Any], provided_secret: str | None, request_id: str = "") -> int | None:
+        self.verify_secret(provided_secret, request_id=request_id, update_id=update.get("update_id"))
+        return self.process_update(update, request_id=request_id, has_secret_header=bool(provided_secret))
+
+    def process_update(
+        self, update: dict[str, Any], request_id: str = "", has_secret_header: bool = False
+    ) -> int | None:
         update_id = update.get("update_id")
+        if self._update_window is not None and isinstance(update_id, int):
+            if self._update_window.check_and_mark(update_id):
+                return None
+
         self._logger.info(
             "telegram_webhook_received",
             extra={
                 "event": "telegram_webhook_received",
                 "request_id": request_id,
                 "update_id": update_id,
-                "has_secret_header": bool(provided_secret),
+                "has_secret_header": has_secret_header,
             },
         )
 
-        if self._expected_secret and provided_secret != self._expected_secret:
-            self._logger.warning(
-                "telegram_webhook_rejected",
-                extra={
-                    "event": "telegram_webhook_rejected",
-                    "request_id": request_id,
-                    "update_id": update_id,
-                    "reason": "invalid_secret",
-                    "has_secret_header": bool(provided_secret),
-                },
-            )
-            raise InvalidTelegramSecretError("Invalid Telegram secret token")
-
         if self._debug_enabled:
             self._logger.debug(
                 "telegram_webhook_debug",
@@ -65,9 +101,11 @@ class ProcessTelegramWebhookUseCase:
                 },
             )
 
-        chat_id = extract_chat_id(update)
-        if chat_id is not None:
-            self._chat_state_gateway.set_last_chat_id(chat_id)
+        chat = extract_chat(update)
+        chat_id = None if chat is None else chat["id"]
+        if chat is not None:
+            self._record_chat(chat)
+            self._chat_state_gateway.set_last_chat_id(chat["id"])
             self._logger.info(
                 "telegram_webhook_chat_captured",
                 extra={
@@ -5,7 +5,7 @@ import time
 from src.entities.task import StartedTask, TaskExecutionRequest
 from src.shared.datetime_utils import to_utc_iso
 from src.use_cases.errors import LastChatNotAvailableError
-from src.use_cases.ports import ChatStateGateway, TelegramNotificationGateway
+from src.use_cases.ports import ChatRegistryGateway, ChatStateGateway, TelegramNotificationGateway
 
 
 class StartTaskUseCase:
@@ -18,8 +18,10 @@ class StartTaskUseCase:
         logger: logging.Logger,
         repository_name: str,
         fallback_chat_id: int | None = None,
+        chat_registry_gateway: ChatRegistryGateway | None = None,
     ) -> None:
         self._chat_state_gateway = chat_state_gateway
+        self._chat_registry_gateway = chat_registry_gateway
         self._telegram_notification_gateway = telegram_notification_gateway
         self._logger = logger
         self._repository_name = repository_name.strip() or "unknown-repository"
@@ -99,7 +101,8 @@ class StartTaskUseCase:
                     "o configura TELEGRAM_CHAT_ID en .env."
                 )
 
-        self._logger.info("Programando tarea para chat_id=%s", chat_id)
+        subscriber_chat_ids = self._subscribers_for(repository_name or self._repository_name)
+        self._logger.info("Programando tarea para chat_id=%s subscribers=%s", chat_id, len(subscriber_chat_ids))
         return StartedTask(
             chat_id=chat_id,
             duration_seconds=request.duration_seconds,
@@ -109,8 +112,18 @@ class StartTaskUseCase:
             execution_time_seconds=request.execution_time_seconds,
             start_datetime=request.start_datetime,
             end_datetime=request.end_datetime,
+            subscriber_chat_ids=subscriber_chat_ids,
         )
 
+    def _subscribers_for(self, repository_name: str) -> tuple[int, ...]:
+        if self._chat_registry_gateway is None:
+            return ()
+        return self._chat_registry_gateway.subscribers_for(repository_name)
+
+    async def _notify(self, task: StartedTask, message: str) -> None:
+        for chat_id in task.recipient_chat_ids:
+            await self._telegram_notification_gateway.send_message(chat_id, message)
+
     async def run_task_and_notify(self, task: StartedTask) -> None:
         self._logger.info(
             "Tarea iniciada. chat_id=%s duration_seconds=%s force_fail=%s modified_files_count=%s",
@@ -130,10 +143,10 @@ class StartTaskUseCase:
             measured_seconds = time.perf_counter() - started_at
             elapsed_seconds = self._resolve_elapsed_seconds(measured_seconds, task.execution_time_seconds)
             message = self._build_notification_message("Termin\u00e9", task, elapsed_seconds)
-            await self._telegram_notification_gateway.send_message(task.chat_id, message)
+            await self._notify(task, message)
         except Exception:
             self._logger.exception("La tarea fallo.")
             measured_seconds = time.perf_counter() - started_at
             elapsed_seconds = self._resolve_elapsed_seconds(measured_seconds, task.execution_time_seconds)
             message = self._build_notification_message("Fall\u00f3", task, elapsed_seconds)
-            await self._telegram_notification_gateway.send_message(task.chat_id, message)
+            await self._notify(task, message)
@@ -1,4 +1,4 @@
-from src.entities.telegram import extract_chat_id
+from src.entities.telegram import chat_display_title, extract_chat, extract_chat_id
 
 
 def test_extract_chat_id_from_message() -> None:
@@ -17,3 +17,14 @@ def test_extract_chat_id_returns_none_when_not_available() -> None:
     assert extract_chat_id({"message": {"chat": {"id": "123"}}}) is None
     assert extract_chat_id({"edited_message": {"chat": {}}}) is None
     assert extract_chat_id({}) is None
+
+
+def test_extract_chat_returns_chat_payload_and_display_title() -> None:
+    group_chat = extract_chat({"message": {"chat": {"id": -100, "type": "supergroup", "title": " Ops "}}})
+    private_chat = extract_chat({"message": {"chat": {"id": 7, "type": "private", "first_name": "Ana"}}})
+
+    assert group_chat == {"id": -100, "type": "supergroup", "title": " Ops "}
+    assert chat_display_title(group_chat) == "Ops"
+    assert private_chat is not None
+    assert chat_display_title(private_chat) == "Ana"
+    assert chat_display_title({"id": 1}) is None
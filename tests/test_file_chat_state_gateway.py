@@ -1,4 +1,5 @@
 import logging
+import time
 
 from src.interface_adapters.gateways.file_chat_state_gateway import FileChatStateGateway
 
@@ -42,3 +43,67 @@ def test_file_chat_state_gateway_persists_chat_id(tmp_path) -> None:
 
     assert gateway.get_last_chat_id() == 999
     assert state_file.read_text(encoding="utf-8").strip() == "999"
+
+
+def _count_writes(gateway: FileChatStateGateway) -> list[int]:
+    writes: list[int] = []
+    persist = gateway._persist_last_chat_id
+
+    def _counting_persist(chat_id: int) -> None:
+        writes.append(chat_id)
+        persist(chat_id)
+
+    gateway._persist_last_chat_id = _counting_persist  # type: ignore[method-assign]
+    return writes
+
+
+def test_file_chat_state_gateway_skips_unchanged_chat_id(tmp_path) -> None:
+    state_file = tmp_path / ".last_chat_id"
+    gateway = FileChatStateGateway(state_file_path=state_file, logger=logging.getLogger("test"))
+    writes = _count_writes(gateway)
+
+    gateway.set_last_chat_id(999)
+    gateway.set_last_chat_id(999)
+
+    assert writes == [999]
+
+
+def test_file_chat_state_gateway_write_behind_coalesces_burst(tmp_path) -> None:
+    state_file = tmp_path / ".last_chat_id"
+    gateway = FileChatStateGateway(
+        state_file_path=state_file,
+        logger=logging.getLogger("test"),
+        write_behind=True,
+        debounce_seconds=60.0,
+    )
+    writes = _count_writes(gateway)
+
+    for chat_id in range(1, 101):
+        gateway.set_last_chat_id(chat_id)
+
+    assert gateway.get_last_chat_id() == 100
+    assert not state_file.exists()
+
+    gateway.close()
+
+    assert writes == [100]
+    assert state_file.read_text(encoding="utf-8").strip() == "100"
+
+
+def test_file_chat_state_gateway_write_behind_persists_after_debounce(tmp_path) -> None:
+    state_file = tmp_path / ".last_chat_id"
+    gateway = FileChatStateGateway(
+        state_file_path=state_file,
+        logger=logging.getLogger("test"),
+        write_behind=True,
+        debounce_seconds=0.01,
+        fsync=True,
+    )
+
+    gateway.set_last_chat_id(321)
+    deadline = time.monotonic() + 2.0
+    while not state_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    gateway.close()
+
+    assert state_file.read_text(encoding="utf-8").strip() == "321"
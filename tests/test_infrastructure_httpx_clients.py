@@ -7,7 +7,7 @@ import pytest
 import src.infrastructure.httpx.telegram_api_client as telegram_api_module
 import src.infrastructure.httpx.telegram_webhook_client as webhook_module
 from src.infrastructure.httpx.telegram_api_client import TelegramApiClient
-from src.infrastructure.httpx.telegram_webhook_client import TelegramWebhookClient
+from src.infrastructure.httpx.telegram_webhook_client import AsyncTelegramWebhookClient, TelegramWebhookClient
 
 
 class DummyAsyncResponse:
@@ -179,3 +179,76 @@ def test_telegram_webhook_client_get_webhook_info(monkeypatch: pytest.MonkeyPatc
 
     assert result["ok"] is True
     assert captured["get_endpoint"] == "https://api.telegram.org/botabc/getWebhookInfo"
+
+
+@pytest.mark.asyncio
+async def test_telegram_api_client_reuses_pooled_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[DummyAsyncClient] = []
+    response = DummyAsyncResponse(payload={"ok": True, "result": {"message_id": 1}})
+
+    def _factory(*, timeout: float) -> DummyAsyncClient:
+        client = DummyAsyncClient(timeout=timeout, response=response, captured={})
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(telegram_api_module.httpx, "AsyncClient", _factory)
+    client = TelegramApiClient(token="bot-token", base_url="https://api.telegram.org", logger=logging.getLogger("test"))
+
+    await client.send_message(chat_id=1, text="a")
+    await client.send_message(chat_id=2, text="b")
+
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_telegram_api_client_warm_up_calls_get_me(monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"ok": True, "result": {"username": "unit_test_bot"}})
+
+    real_async_client = httpx.AsyncClient
+
+    def _factory(*, timeout: float) -> httpx.AsyncClient:
+        return real_async_client(timeout=timeout, transport=httpx.MockTransport(_handler))
+
+    monkeypatch.setattr(telegram_api_module.httpx, "AsyncClient", _factory)
+    client = TelegramApiClient(token="abc", base_url="https://api.telegram.org", logger=logging.getLogger("test"))
+
+    assert await client.warm_up() is True
+    await client.aclose()
+
+    assert requested == ["https://api.telegram.org/botabc/getMe"]
+
+
+@pytest.mark.asyncio
+async def test_async_telegram_webhook_client_shares_one_http_client() -> None:
+    requested: list[tuple[str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append((request.method, str(request.url)))
+        if request.url.path.endswith("/setWebhook"):
+            assert b"secret_token=secret-value" in request.content
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(200, json={"ok": True, "result": {"pending_update_count": 0}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+        client = AsyncTelegramWebhookClient(
+            telegram_token="abc",
+            telegram_api_base_url="https://api.telegram.org/",
+            http_client=http_client,
+        )
+        set_result = await client.set_webhook(
+            webhook_url="https://api.example.com/telegram/webhook",
+            secret_token="secret-value",
+            drop_pending_updates=False,
+        )
+        info_result = await client.get_webhook_info()
+
+    assert set_result == {"ok": True}
+    assert info_result["result"]["pending_update_count"] == 0
+    assert requested == [
+        ("POST", "https://api.telegram.org/botabc/setWebhook"),
+        ("GET", "https://api.telegram.org/botabc/getWebhookInfo"),
+    ]
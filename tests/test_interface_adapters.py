@@ -26,6 +26,15 @@ class DummyProcessWebhookUseCase:
         self.calls.append((update, provided_secret))
         return self.result
 
+    def verify_secret(self, provided_secret: str | None, request_id: str = "") -> None:
+        self.calls.append(({}, provided_secret))
+
+    def process_update(
+        self, update: dict[str, object], request_id: str = "", has_secret_header: bool = False
+    ) -> int | None:
+        self.calls.append((update, None))
+        return self.result
+
 
 class DummyGetLastChatUseCase:
     def __init__(self, result: int | None) -> None:
@@ -83,3 +92,17 @@ def test_presenters_return_expected_payloads() -> None:
     assert task_response["end_datetime"] == "2026-02-18T10:00:01Z"
     assert present_webhook_result(11) == {"ok": True, "captured_chat_id": 11}
     assert present_last_chat(22) == {"last_chat_id": 22}
+
+
+def test_telegram_controller_authorizes_before_processing_update() -> None:
+    process_use_case = DummyProcessWebhookUseCase(result=555)
+    controller = TelegramController(  # type: ignore[arg-type]
+        process_webhook_use_case=process_use_case,
+        get_last_chat_use_case=DummyGetLastChatUseCase(result=None),
+    )
+
+    controller.authorize_webhook("secret")
+    response = controller.handle_authorized_webhook({"update_id": 2})
+
+    assert response == {"ok": True, "captured_chat_id": 555}
+    assert process_use_case.calls == [({}, "secret"), ({"update_id": 2}, None)]
@@ -119,3 +119,11 @@ def test_validate_startup_settings_requires_forwarded_allow_ips_when_proxy_heade
 
     with pytest.raises(RuntimeError, match="FORWARDED_ALLOW_IPS"):
         validate_startup_settings(broken)
+
+
+def test_validate_startup_settings_rejects_unknown_ingestion_mode() -> None:
+    settings = _valid_settings()
+    broken = Settings(**{**settings.__dict__, "telegram_ingestion_mode": "push"})
+
+    with pytest.raises(RuntimeError, match="TELEGRAM_INGESTION_MODE invalid"):
+        validate_startup_settings(broken)
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+import logging
+
+from src.infrastructure.sqlite.sqlite_chat_registry_gateway import SqliteChatRegistryGateway
+
+
+def _registry(tmp_path, **kwargs: object) -> SqliteChatRegistryGateway:
+    return SqliteChatRegistryGateway(
+        database_path=tmp_path / ".chat_registry.sqlite3",
+        logger=logging.getLogger("test"),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_chat_registry_does_not_create_database_until_first_write(tmp_path) -> None:
+    registry = _registry(tmp_path)
+
+    assert registry.get_last_chat_id() is None
+    assert registry.list_chats() == []
+    registry.close()
+
+    assert not (tmp_path / ".chat_registry.sqlite3").exists()
+
+
+def test_chat_registry_records_chats_and_restores_them(tmp_path) -> None:
+    seen_at = datetime(2026, 2, 18, 10, 0, 0, tzinfo=timezone.utc)
+    registry = _registry(tmp_path, write_behind=False)
+
+    registry.record_chat(chat_id=-100, chat_type="supergroup", title="Ops", seen_at=seen_at)
+    registry.record_chat(chat_id=7, chat_type="private", title="Ana", seen_at=seen_at)
+    registry.set_last_chat_id(7)
+    registry.subscribe(-100, "datamaq-communications-api")
+    registry.close()
+
+    restored = _registry(tmp_path)
+    chat = restored.get_chat(-100)
+
+    assert restored.get_last_chat_id() == 7
+    assert {record.chat_id for record in restored.list_chats()} == {-100, 7}
+    assert chat is not None
+    assert chat.chat_type == "supergroup"
+    assert chat.title == "Ops"
+    assert chat.last_seen_at == seen_at
+    assert chat.subscriptions == frozenset({"datamaq-communications-api"})
+    assert restored.subscribers_for("datamaq-communications-api") == (-100,)
+    restored.close()
+
+
+def test_chat_registry_keeps_known_fields_when_update_omits_them(tmp_path) -> None:
+    registry = _registry(tmp_path, write_behind=False)
+    first_seen = datetime(2026, 2, 18, 10, 0, 0, tzinfo=timezone.utc)
+    second_seen = datetime(2026, 2, 18, 11, 0, 0, tzinfo=timezone.utc)
+
+    registry.record_chat(chat_id=5, chat_type="group", title="Equipo", seen_at=first_seen)
+    registry.record_chat(chat_id=5, chat_type=None, title=None, seen_at=second_seen)
+
+    chat = registry.get_chat(5)
+    assert chat is not None
+    assert chat.chat_type == "group"
+    assert chat.title == "Equipo"
+    assert chat.last_seen_at == second_seen
+    registry.close()
+
+
+def test_chat_registry_subscribe_and_unsubscribe_update_repository_index(tmp_path) -> None:
+    registry = _registry(tmp_path, write_behind=False)
+
+    assert registry.subscribe(1, "repo-a") is True
+    assert registry.subscribe(1, "repo-a") is False
+    assert registry.subscribe(2, " repo-a ") is True
+    assert registry.subscribe(2, "   ") is False
+    assert registry.subscribers_for("repo-a") == (1, 2)
+
+    assert registry.unsubscribe(1, "repo-a") is True
+    assert registry.unsubscribe(1, "repo-a") is False
+    assert registry.subscribers_for("repo-a") == (2,)
+    registry.close()
+
+    assert _registry(tmp_path).subscribers_for("repo-a") == (2,)
+
+
+def test_chat_registry_write_behind_defers_writes_until_flush(tmp_path) -> None:
+    database_path = tmp_path / ".chat_registry.sqlite3"
+    registry = _registry(tmp_path, write_behind=True, debounce_seconds=60.0)
+
+    for update_index in range(50):
+        registry.record_chat(
+            chat_id=-100,
+            chat_type="supergroup",
+            title="Ops",
+            seen_at=datetime(2026, 2, 18, 10, 0, update_index, tzinfo=timezone.utc),
+        )
+        registry.set_last_chat_id(-100)
+
+    assert not database_path.exists()
+    registry.close()
+
+    restored = _registry(tmp_path)
+    chat = restored.get_chat(-100)
+    assert restored.get_last_chat_id() == -100
+    assert chat is not None
+    assert chat.last_seen_at == datetime(2026, 2, 18, 10, 0, 49, tzinfo=timezone.utc)
+    restored.close()
+
+
+def test_chat_registry_persists_telegram_update_offset(tmp_path) -> None:
+    registry = _registry(tmp_path)
+    registry.set_update_offset(100)
+    registry.set_update_offset(101)
+    registry.close()
+
+    restored = _registry(tmp_path)
+    assert restored.get_update_offset() == 101
+    assert restored.get_last_chat_id() is None
+    restored.close()
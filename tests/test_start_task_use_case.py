@@ -29,11 +29,20 @@ class DummyTelegramNotificationGateway:
         self.messages.append((chat_id, text))
 
 
+class DummyChatRegistryGateway:
+    def __init__(self, subscribers: dict[str, tuple[int, ...]]) -> None:
+        self.subscribers = subscribers
+
+    def subscribers_for(self, repository: str) -> tuple[int, ...]:
+        return self.subscribers.get(repository, ())
+
+
 def _build_use_case(
     *,
     last_chat_id: int | None = None,
     fallback_chat_id: int | None = None,
     repository_name: str = "repo-default",
+    subscribers: dict[str, tuple[int, ...]] | None = None,
 ) -> tuple[StartTaskUseCase, DummyChatStateGateway, DummyTelegramNotificationGateway]:
     chat_gateway = DummyChatStateGateway(last_chat_id=last_chat_id)
     telegram_gateway = DummyTelegramNotificationGateway()
@@ -43,6 +52,9 @@ def _build_use_case(
         logger=logging.getLogger("test"),
         repository_name=repository_name,
         fallback_chat_id=fallback_chat_id,
+        chat_registry_gateway=(
+            DummyChatRegistryGateway(subscribers) if subscribers is not None else None  # type: ignore[arg-type]
+        ),
     )
     return use_case, chat_gateway, telegram_gateway
 
@@ -133,3 +145,18 @@ async def test_run_task_and_notify_sends_failure_message_when_forced() -> None:
     assert "Fall" in text
     assert "Repositorio: repo-fallback" in text
     assert "Archivos modificados: 0" in text
+
+
+@pytest.mark.asyncio
+async def test_run_task_and_notify_routes_to_repository_subscribers() -> None:
+    use_case, _, telegram_gateway = _build_use_case(
+        last_chat_id=101,
+        repository_name="repo-default",
+        subscribers={"my-repo": (101, 202, 303)},
+    )
+
+    task = use_case.start(TaskExecutionRequest(duration_seconds=0.0, repository_name="my-repo"))
+    await use_case.run_task_and_notify(task)
+
+    assert task.subscriber_chat_ids == (101, 202, 303)
+    assert [chat_id for chat_id, _ in telegram_gateway.messages] == [101, 202, 303]
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from src.infrastructure.startup.startup_orchestrator import StartupOrchestrator
+
+
+@pytest.mark.asyncio
+async def test_startup_orchestrator_runs_steps_concurrently_and_records_timings() -> None:
+    orchestrator = StartupOrchestrator(logging.getLogger("test"))
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(
+        orchestrator.run_step("server_boot", asyncio.sleep(0.1, result="ready")),
+        orchestrator.run_step("ngrok_tunnel", asyncio.sleep(0.1, result="https://unit-test.ngrok.io")),
+    )
+    elapsed = time.perf_counter() - started_at
+
+    assert results == ["ready", "https://unit-test.ngrok.io"]
+    assert elapsed < 0.19
+    assert {timing.name for timing in orchestrator.timings} == {"server_boot", "ngrok_tunnel"}
+    assert all(timing.ok and timing.duration_ms >= 90 for timing in orchestrator.timings)
+
+
+@pytest.mark.asyncio
+async def test_startup_orchestrator_records_failed_step_and_reraises() -> None:
+    orchestrator = StartupOrchestrator(logging.getLogger("test"))
+
+    async def _failing_step() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.run_step("telegram_webhook", _failing_step())
+
+    assert len(orchestrator.timings) == 1
+    assert orchestrator.timings[0].name == "telegram_webhook"
+    assert orchestrator.timings[0].ok is False
@@ -121,3 +121,51 @@ def test_tasks_start_validation_error_contains_cmd_hint(tmp_path) -> None:
     detail = response.json()["detail"]
     assert "errors" in detail
     assert "hint" in detail
+
+
+def test_telegram_webhook_acknowledges_redelivered_update_without_processing(tmp_path) -> None:
+    settings = _settings_for_test(tmp_path, fallback_chat_id=None, webhook_secret="")
+
+    with _client(settings) as api_client:
+        first = api_client.post("/telegram/webhook", json={"update_id": 50, "message": {"chat": {"id": 888}}})
+        redelivered = api_client.post("/telegram/webhook", json={"update_id": 50, "message": {"chat": {"id": 999}}})
+        last_chat_response = api_client.get("/telegram/last_chat")
+
+    assert first.json() == {"ok": True, "captured_chat_id": 888}
+    assert redelivered.status_code == 200
+    assert redelivered.json() == {"ok": True, "captured_chat_id": None}
+    assert last_chat_response.json() == {"last_chat_id": 888}
+
+
+def test_telegram_webhook_rejects_forged_secret_before_parsing_body(tmp_path) -> None:
+    settings = _settings_for_test(tmp_path, fallback_chat_id=None, webhook_secret="expected-secret")
+
+    with _client(settings) as api_client:
+        response = api_client.post(
+            "/telegram/webhook",
+            content="{not-json",
+            headers={"Content-Type": "application/json", "X-Telegram-Bot-Api-Secret-Token": "forged"},
+        )
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Invalid Telegram secret token"
+
+
+def test_telegram_webhook_returns_422_for_invalid_body(tmp_path) -> None:
+    settings = _settings_for_test(tmp_path, fallback_chat_id=None, webhook_secret="secret-123")
+
+    with _client(settings) as api_client:
+        invalid_json = api_client.post(
+            "/telegram/webhook",
+            content="{not-json",
+            headers={"Content-Type": "application/json", "X-Telegram-Bot-Api-Secret-Token": "secret-123"},
+        )
+        not_an_object = api_client.post(
+            "/telegram/webhook",
+            json=[1, 2, 3],
+            headers={"X-Telegram-Bot-Api-Secret-Token": "secret-123"},
+        )
+
+    assert invalid_json.status_code == 422
+    assert not_an_object.status_code == 422
+    assert not_an_object.json()["detail"] == "Invalid Telegram update payload"
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+import src.infrastructure.httpx.telegram_api_client as telegram_api_module
+from src.infrastructure.httpx.telegram_api_client import TelegramApiClient
+from src.infrastructure.httpx.telegram_update_poller import TelegramUpdatePoller
+from src.infrastructure.sqlite.sqlite_chat_registry_gateway import SqliteChatRegistryGateway
+from src.use_cases.process_telegram_webhook import ProcessTelegramWebhookUseCase
+
+
+def _registry(tmp_path) -> SqliteChatRegistryGateway:
+    return SqliteChatRegistryGateway(tmp_path / ".chat_registry.sqlite3", logging.getLogger("test"), write_behind=False)
+
+
+def _poller(tmp_path, telegram_api_client: TelegramApiClient) -> tuple[TelegramUpdatePoller, SqliteChatRegistryGateway]:
+    registry = _registry(tmp_path)
+    use_case = ProcessTelegramWebhookUseCase(
+        chat_state_gateway=registry,
+        expected_secret="ignored-in-polling",
+        logger=logging.getLogger("test"),
+        chat_registry_gateway=registry,
+    )
+    poller = TelegramUpdatePoller(
+        telegram_api_client=telegram_api_client,
+        process_webhook_use_case=use_case,
+        offset_gateway=registry,
+        logger=logging.getLogger("test"),
+        timeout_seconds=0,
+    )
+    return poller, registry
+
+
+def test_poller_process_batch_advances_and_persists_offset(tmp_path) -> None:
+    client = TelegramApiClient(token="abc", base_url="https://api.telegram.org", logger=logging.getLogger("test"))
+    poller, registry = _poller(tmp_path, client)
+
+    next_offset = poller.process_batch(
+        [
+            {"update_id": 41, "message": {"chat": {"id": 7, "type": "private"}}},
+            {"update_id": 42, "message": {"chat": {"id": -100, "type": "group", "title": "Ops"}}},
+        ],
+        offset=None,
+    )
+    registry.close()
+
+    assert next_offset == 43
+    restored = _registry(tmp_path)
+    assert restored.get_update_offset() == 43
+    assert restored.get_last_chat_id() == -100
+    restored.close()
+
+
+@pytest.mark.asyncio
+async def test_poller_long_polls_with_persisted_offset_on_one_connection(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requests: list[tuple[str, dict]] = []
+    second_poll_seen = asyncio.Event()
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content or b"{}")
+        requests.append((request.url.path.rsplit("/", 1)[-1], payload))
+        if request.url.path.endswith("/deleteWebhook"):
+            return httpx.Response(200, json={"ok": True, "result": True})
+        if payload.get("offset") == 10:
+            return httpx.Response(
+                200, json={"ok": True, "result": [{"update_id": 10, "message": {"chat": {"id": 555}}}]}
+            )
+        second_poll_seen.set()
+        return httpx.Response(200, json={"ok": True, "result": []})
+
+    real_async_client = httpx.AsyncClient
+    created: list[httpx.AsyncClient] = []
+
+    def _factory(*, timeout: float) -> httpx.AsyncClient:
+        client = real_async_client(timeout=timeout, transport=httpx.MockTransport(_handler))
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(telegram_api_module.httpx, "AsyncClient", _factory)
+    client = TelegramApiClient(token="abc", base_url="https://api.telegram.org", logger=logging.getLogger("test"))
+    poller, registry = _poller(tmp_path, client)
+    registry.set_update_offset(10)
+
+    poller.start()
+    await asyncio.wait_for(second_poll_seen.wait(), timeout=2.0)
+    await poller.stop()
+    await client.aclose()
+
+    assert requests[0] == ("deleteWebhook", {"drop_pending_updates": False})
+    assert requests[1] == ("getUpdates", {"timeout": 0, "limit": 100, "offset": 10})
+    assert requests[2][1]["offset"] == 11
+    assert registry.get_update_offset() == 11
+    assert registry.get_last_chat_id() == 555
+    assert len(created) == 1
+    registry.close()
+
+
+@pytest.mark.asyncio
+async def test_poller_backs_off_when_get_updates_fails(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        if len(sleeps) >= 3:
+            raise asyncio.CancelledError
+        await real_sleep(0)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/deleteWebhook"):
+            return httpx.Response(200, json={"ok": True, "result": True})
+        return httpx.Response(409, json={"ok": False, "description": "Conflict"})
+
+    real_async_client = httpx.AsyncClient
+
+    def _factory(*, timeout: float) -> httpx.AsyncClient:
+        return real_async_client(timeout=timeout, transport=httpx.MockTransport(_handler))
+
+    monkeypatch.setattr(telegram_api_module.httpx, "AsyncClient", _factory)
+    monkeypatch.setattr("src.infrastructure.httpx.telegram_update_poller.asyncio.sleep", _fake_sleep)
+    client = TelegramApiClient(token="abc", base_url="https://api.telegram.org", logger=logging.getLogger("test"))
+    poller, registry = _poller(tmp_path, client)
+
+    with pytest.raises(asyncio.CancelledError):
+        await poller.run()
+    await client.aclose()
+
+    assert sleeps == [1.0, 2.0, 4.0]
+    assert registry.get_update_offset() is None
+    registry.close()
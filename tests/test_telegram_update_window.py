@@ -0,0 +1,42 @@
+from src.entities.telegram_update_window import RecentUpdateIdWindow
+
+
+def test_update_window_flags_redelivered_update_ids() -> None:
+    window = RecentUpdateIdWindow(size=8)
+
+    assert window.check_and_mark(100) is False
+    assert window.check_and_mark(100) is True
+    assert window.check_and_mark(101) is False
+    assert window.check_and_mark(100) is True
+    assert window.high_water_mark == 101
+
+
+def test_update_window_accepts_out_of_order_ids_inside_window() -> None:
+    window = RecentUpdateIdWindow(size=8)
+
+    assert window.check_and_mark(10) is False
+    assert window.check_and_mark(8) is False
+    assert window.check_and_mark(9) is False
+    assert window.check_and_mark(8) is True
+    assert window.check_and_mark(9) is True
+
+
+def test_update_window_treats_ids_older_than_window_as_duplicates() -> None:
+    window = RecentUpdateIdWindow(size=8)
+
+    window.check_and_mark(1)
+    window.check_and_mark(20)
+
+    assert window.check_and_mark(12) is True
+    assert window.check_and_mark(13) is False
+
+
+def test_update_window_forgets_bits_after_large_jump() -> None:
+    window = RecentUpdateIdWindow(size=4)
+
+    window.check_and_mark(1)
+    window.check_and_mark(2)
+    window.check_and_mark(1000)
+
+    assert window.check_and_mark(999) is False
+    assert window.check_and_mark(1000) is True
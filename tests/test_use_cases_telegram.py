@@ -1,7 +1,9 @@
+from datetime import datetime
 import logging
 
 import pytest
 
+from src.entities.telegram_update_window import RecentUpdateIdWindow
 from src.use_cases.errors import InvalidTelegramSecretError
 from src.use_cases.get_last_chat import GetLastChatUseCase
 from src.use_cases.process_telegram_webhook import ProcessTelegramWebhookUseCase
@@ -20,6 +22,14 @@ class DummyChatStateGateway:
         self.set_calls.append(chat_id)
 
 
+class DummyChatRegistryGateway:
+    def __init__(self) -> None:
+        self.recorded: list[tuple[int, str | None, str | None]] = []
+
+    def record_chat(self, chat_id: int, chat_type: str | None, title: str | None, seen_at: datetime) -> None:
+        self.recorded.append((chat_id, chat_type, title))
+
+
 def test_get_last_chat_use_case_returns_gateway_value() -> None:
     gateway = DummyChatStateGateway(last_chat_id=777)
     use_case = GetLastChatUseCase(chat_state_gateway=gateway, logger=logging.getLogger("test"))
@@ -71,3 +81,65 @@ def test_process_telegram_webhook_accepts_update_without_chat_id() -> None:
 
     assert chat_id is None
     assert gateway.set_calls == []
+
+
+def test_process_telegram_webhook_records_chat_in_registry() -> None:
+    gateway = DummyChatStateGateway()
+    registry = DummyChatRegistryGateway()
+    use_case = ProcessTelegramWebhookUseCase(
+        chat_state_gateway=gateway,
+        expected_secret="",
+        logger=logging.getLogger("test"),
+        chat_registry_gateway=registry,  # type: ignore[arg-type]
+    )
+
+    use_case.execute(
+        update={"update_id": 12, "message": {"chat": {"id": -100, "type": "supergroup", "title": "Ops"}}},
+        provided_secret=None,
+    )
+
+    assert registry.recorded == [(-100, "supergroup", "Ops")]
+    assert gateway.set_calls == [-100]
+
+
+def test_process_telegram_webhook_skips_redelivered_update() -> None:
+    gateway = DummyChatStateGateway()
+    use_case = ProcessTelegramWebhookUseCase(
+        chat_state_gateway=gateway,
+        expected_secret="",
+        logger=logging.getLogger("test"),
+        update_window=RecentUpdateIdWindow(size=16),
+    )
+    update = {"update_id": 13, "message": {"chat": {"id": 999}}}
+
+    assert use_case.execute(update=update, provided_secret=None) == 999
+    assert use_case.execute(update=update, provided_secret=None) is None
+    assert gateway.set_calls == [999]
+
+
+def test_process_telegram_webhook_checks_secret_before_dedup() -> None:
+    window = RecentUpdateIdWindow(size=16)
+    use_case = ProcessTelegramWebhookUseCase(
+        chat_state_gateway=DummyChatStateGateway(),
+        expected_secret="expected-secret",
+        logger=logging.getLogger("test"),
+        update_window=window,
+    )
+
+    with pytest.raises(InvalidTelegramSecretError):
+        use_case.execute(update={"update_id": 14}, provided_secret="wrong-secret")
+
+    assert window.high_water_mark is None
+
+
+def test_process_telegram_webhook_verify_secret_accepts_matching_secret_only() -> None:
+    use_case = ProcessTelegramWebhookUseCase(
+        chat_state_gateway=DummyChatStateGateway(),
+        expected_secret=" expected-secret ",
+        logger=logging.getLogger("test"),
+    )
+
+    use_case.verify_secret("expected-secret")
+    for provided_secret in (None, "", "expected-secret-2", "expected"):
+        with pytest.raises(InvalidTelegramSecretError):
+            use_case.verify_secret(provided_secret)